@@ -0,0 +1,51 @@
+"""server-side timestamps
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs that used to be filled by datetime.utcnow in Python
+COLUMNS = [("enrollments", "created_at"), ("contacts", "submitted_at")]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        # Existing values were naive UTC timestamps
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=sa.func.now(),
+        )
+        op.execute(f"UPDATE {table} SET {column} = now() WHERE {column} IS NULL")
+        op.alter_column(table, column, nullable=False, existing_type=sa.DateTime(timezone=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None,
+            nullable=True,
+        )
@@ -0,0 +1,42 @@
+"""hot path indexes and unique enrollments
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f("ix_users_role"), "users", ["role"], unique=False)
+    op.create_index(op.f("ix_gigs_user_id"), "gigs", ["user_id"], unique=False)
+    op.create_index(op.f("ix_jobs_buyer_id"), "jobs", ["buyer_id"], unique=False)
+    op.create_index("ix_courses_cat_price", "courses", ["category", "price"], unique=False)
+
+    # The old check-then-insert enrollment could race into duplicates; keep the earliest row
+    op.execute(
+        "DELETE FROM enrollments a USING enrollments b "
+        "WHERE a.user_id = b.user_id AND a.course_id = b.course_id AND a.id > b.id"
+    )
+    # /enrollments/ relies on this constraint for ON CONFLICT (user_id, course_id)
+    op.create_unique_constraint("uq_enroll", "enrollments", ["user_id", "course_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_enroll", "enrollments", type_="unique")
+    op.drop_index("ix_courses_cat_price", table_name="courses")
+    op.drop_index(op.f("ix_jobs_buyer_id"), table_name="jobs")
+    op.drop_index(op.f("ix_gigs_user_id"), table_name="gigs")
+    op.drop_index(op.f("ix_users_role"), table_name="users")
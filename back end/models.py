@@ -0,0 +1,94 @@
+# models.py
+# ORM models, kept apart from main.py so Alembic can load the metadata without
+# building the app
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Float, DateTime, Index, UniqueConstraint, func
+from sqlalchemy.orm import declarative_base, relationship
+
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    email = Column(String, unique=True, index=True)
+    role = Column(String, default="buyer", index=True)  # buyer, freelancer, admin
+    bio = Column(Text, nullable=True)
+    skills = Column(Text, nullable=True)
+    rating = Column(Float, default=0.0)
+    profile_pic = Column(String, nullable=True)
+
+    gigs = relationship("Gig", back_populates="owner")
+    applications = relationship("Application", back_populates="freelancer")
+
+class Gig(Base):
+    __tablename__ = "gigs"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    category = Column(String)
+    price = Column(Integer)
+    revisions = Column(Integer)
+    delivery = Column(Integer)
+    image_path = Column(String)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+    owner = relationship("User", back_populates="gigs")
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    category = Column(String)
+    status = Column(String, default="Pending")
+    freelancer = Column(String, nullable=True)
+    budget_type = Column(String)
+    deadline = Column(String)
+    skills = Column(Text)
+    buyer_id = Column(Integer, ForeignKey("users.id"), index=True)
+
+
+class Application(Base):
+    __tablename__ = "applications"
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"))
+    freelancer_id = Column(Integer, ForeignKey("users.id"))
+    message = Column(Text)
+
+    freelancer = relationship("User", back_populates="applications")
+
+
+class Course(Base):
+    __tablename__ = "courses"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    instructor = Column(String, nullable=False)
+    description = Column(Text, nullable=False)
+    category = Column(String, nullable=False)
+    price = Column(Integer, nullable=False)
+    thumbnail = Column(String, nullable=True)
+
+    # Serves both the category filter and category + price (is_free) lookups
+    __table_args__ = (Index("ix_courses_cat_price", "category", "price"),)
+
+
+class Enrollment(Base):
+    __tablename__ = "enrollments"
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Also covers lookups by user_id alone
+    __table_args__ = (UniqueConstraint("user_id", "course_id", name="uq_enroll"),)
+
+
+class Contact(Base):
+    __tablename__ = "contacts"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    submitted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
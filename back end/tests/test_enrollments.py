@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+import main
+
+
+class FakeSession:
+    # Stands in for AsyncSession: records the statement, returns a canned INSERT ... RETURNING row
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return SimpleNamespace(first=lambda: self.row)
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def enroll():
+    # No `with` block, so lifespan (Postgres pool, Redis) never runs
+    def post(row):
+        session = FakeSession(row)
+        main.app.dependency_overrides[main.get_db] = lambda: session
+        r = TestClient(main.app).post("/enrollments/", data={"user_id": "1", "course_id": "2"})
+        return r, session
+
+    yield post
+    main.app.dependency_overrides.clear()
+
+
+def test_new_enrollment_is_created(enroll):
+    r, session = enroll(SimpleNamespace(id=5))
+
+    assert r.status_code == 200
+    assert r.json() == {"message": "Enrollment successful", "enrollment_id": 5}
+    assert session.committed
+
+
+def test_duplicate_enrollment_is_400(enroll):
+    r, session = enroll(None)
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Already enrolled"
+    assert not session.committed
+
+
+def test_enrollment_is_a_single_insert_on_conflict(enroll):
+    _, session = enroll(None)
+
+    (stmt,) = session.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO enrollments")
+    assert "ON CONFLICT (user_id, course_id) DO NOTHING RETURNING enrollments.id" in sql
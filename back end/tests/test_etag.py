@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+import main
+
+ORIGIN = "http://localhost:5173"
+
+
+@pytest.fixture
+def client():
+    # Same middleware stack as main.app, in front of routes that don't need Postgres/Redis
+    app = FastAPI()
+
+    @app.get("/gigs/")
+    async def gigs():
+        return {"items": [{"id": i, "title": "x" * 50} for i in range(50)], "next_cursor": None}
+
+    @app.get("/courses/")
+    async def courses():
+        return PlainTextResponse("not json")
+
+    @app.get("/other/")
+    async def other():
+        return {"ok": True}
+
+    app.add_middleware(CORSMiddleware, allow_origins=[ORIGIN], allow_credentials=True)
+    app.add_middleware(main.JSONETagMiddleware, paths=("/gigs/", "/courses/"))
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+
+def test_etag_is_stable_across_calls(client):
+    first = client.get("/gigs/")
+    second = client.get("/gigs/")
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["etag"].startswith('W/"')
+    assert first.headers["etag"] == second.headers["etag"]
+
+
+@pytest.mark.parametrize("header", ["{etag}", '"other", {etag}', "{strong}", "*"])
+def test_matching_if_none_match_is_304(client, header):
+    etag = client.get("/gigs/").headers["etag"]
+
+    r = client.get("/gigs/", headers={"If-None-Match": header.format(etag=etag, strong=etag[2:])})
+
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+
+
+def test_stale_if_none_match_gets_full_body(client):
+    r = client.get("/gigs/", headers={"If-None-Match": 'W/"stale"'})
+
+    assert r.status_code == 200
+    assert len(r.json()["items"]) == 50
+
+
+def test_304_keeps_vary_and_cors_headers(client):
+    etag = client.get("/gigs/", headers={"Origin": ORIGIN}).headers["etag"]
+
+    r = client.get("/gigs/", headers={"Origin": ORIGIN, "If-None-Match": etag})
+
+    assert r.status_code == 304
+    assert r.headers["access-control-allow-origin"] == ORIGIN
+    assert r.headers["access-control-allow-credentials"] == "true"
+    vary = {v.strip() for v in r.headers["vary"].split(",")}
+    assert {"Origin", "Accept-Encoding"} <= vary
+
+
+def test_unscoped_and_non_json_responses_are_untouched(client):
+    assert "etag" not in client.get("/other/").headers
+    assert "etag" not in client.get("/courses/").headers
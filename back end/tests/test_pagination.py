@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, literal, select, union_all
+from sqlalchemy.dialects import postgresql
+
+import main
+
+
+def compiled_sql(pagination):
+    stmt = pagination.apply(select(main.Gig.id), main.Gig.id)
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def mappings(*ids):
+    # Real RowMappings, as returned by `.mappings().all()` in the list routes
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        stmt = union_all(*(select(literal(i).label("id")) for i in ids))
+        return conn.execute(stmt).mappings().all()
+
+
+def test_apply_orders_newest_first_with_limit_and_offset():
+    sql = compiled_sql(main.Pagination(limit=20, offset=40, after_id=None))
+
+    assert "WHERE" not in sql
+    assert "ORDER BY gigs.id DESC" in sql
+    assert "LIMIT 20 OFFSET 40" in sql
+
+
+def test_apply_combines_after_id_cursor_with_offset():
+    sql = compiled_sql(main.Pagination(limit=10, offset=5, after_id=123))
+
+    assert "WHERE gigs.id < 123" in sql
+    assert "ORDER BY gigs.id DESC" in sql
+    assert "LIMIT 10 OFFSET 5" in sql
+
+
+def test_full_page_of_rows_has_next_cursor():
+    page = main.Pagination(limit=2, offset=0, after_id=None).page(mappings(9, 7))
+
+    assert page["next_cursor"] == 7
+    assert [row["id"] for row in page["items"]] == [9, 7]
+
+
+def test_full_page_of_objects_has_next_cursor():
+    items = [SimpleNamespace(id=9), SimpleNamespace(id=7)]
+
+    assert main.Pagination(limit=2, offset=0, after_id=None).page(items)["next_cursor"] == 7
+
+
+def test_short_page_has_no_next_cursor():
+    pagination = main.Pagination(limit=3, offset=0, after_id=None)
+
+    assert pagination.page(mappings(9, 7))["next_cursor"] is None
+    assert pagination.page([])["next_cursor"] is None
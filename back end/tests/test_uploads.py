@@ -0,0 +1,212 @@
+import hashlib
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import main
+
+GIG_FIELDS = {
+    "title": "Logo design",
+    "description": "A logo",
+    "category": "Design",
+    "price": "50",
+    "revisions": "2",
+    "delivery": "3",
+    "user_id": "1",
+}
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    uploads = tmp_path / "uploads"
+    uploads_tmp = tmp_path / "uploads_tmp"
+    uploads.mkdir()
+    monkeypatch.setattr(main, "UPLOADS_DIR", str(uploads))
+    monkeypatch.setattr(main, "UPLOADS_TMP_DIR", str(uploads_tmp))
+    return uploads, uploads_tmp
+
+
+@pytest.fixture
+def client(dirs):
+    # The real routes need Postgres; exercise _parse_form through a bare app instead
+    app = FastAPI()
+
+    @app.post("/gig")
+    async def gig(request: Request):
+        form, paths = await main._parse_form(request, main.GigCreate, required_files=("image",))
+        return {"form": form.model_dump(), "paths": paths}
+
+    @app.post("/course")
+    async def course(request: Request):
+        form, paths = await main._parse_form(request, main.CourseCreate)
+        return {"form": form.model_dump(), "paths": paths}
+
+    return TestClient(app)
+
+
+def leftovers(path):
+    return os.listdir(path) if os.path.exists(path) else []
+
+
+def test_file_is_stored_under_content_hash(client, dirs):
+    uploads, uploads_tmp = dirs
+    image = os.urandom(3 * 1024 * 1024)
+
+    r = client.post("/gig", data=GIG_FIELDS, files={"image": ("logo.PNG", image, "image/png")})
+
+    assert r.status_code == 200
+    assert r.json()["form"]["price"] == 50
+    digest = hashlib.sha256(image).hexdigest()
+    assert r.json()["paths"]["image"] == f"{uploads}/{digest}.png"
+    assert (uploads / f"{digest}.png").read_bytes() == image
+    assert leftovers(uploads_tmp) == []
+
+
+def test_duplicate_upload_is_stored_once(client, dirs):
+    uploads, uploads_tmp = dirs
+    for _ in range(2):
+        r = client.post("/gig", data=GIG_FIELDS, files={"image": ("a.png", b"same bytes")})
+        assert r.status_code == 200
+
+    assert len(os.listdir(uploads)) == 1
+    assert leftovers(uploads_tmp) == []
+
+
+def test_unexpected_file_fields_are_not_written(client, dirs):
+    uploads, uploads_tmp = dirs
+    r = client.post(
+        "/gig",
+        data=GIG_FIELDS,
+        files={"image": ("a.png", b"img"), "other": ("x.bin", b"junk")},
+    )
+
+    assert r.status_code == 200
+    assert list(r.json()["paths"]) == ["image"]
+    assert len(os.listdir(uploads)) == 1
+    assert leftovers(uploads_tmp) == []
+
+
+def test_empty_file_part_means_no_file(client, dirs):
+    uploads, _ = dirs
+    data = {"title": "t", "instructor": "i", "description": "d", "category": "c", "price": "0"}
+
+    r = client.post("/course", data=data, files={"image": ("", b"", "application/octet-stream")})
+
+    assert r.status_code == 200
+    assert r.json()["paths"] == {}
+    assert os.listdir(uploads) == []
+
+
+def test_urlencoded_body_without_file_is_accepted(client):
+    data = {"title": "t", "instructor": "i", "description": "d", "category": "c", "price": "0"}
+
+    r = client.post("/course", data=data)
+
+    assert r.status_code == 200
+    assert r.json()["form"]["price"] == 0
+
+
+def test_invalid_field_is_422_and_file_is_discarded(client, dirs):
+    uploads, uploads_tmp = dirs
+
+    r = client.post("/gig", data={**GIG_FIELDS, "price": "cheap"}, files={"image": ("a.png", b"img")})
+
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "price"]
+    assert os.listdir(uploads) == []
+    assert leftovers(uploads_tmp) == []
+
+
+def test_missing_required_file_is_422(client):
+    r = client.post("/gig", data=GIG_FIELDS, files={"other": ("x.bin", b"junk")})
+
+    assert r.status_code == 422
+    assert r.json()["detail"] == [{"type": "missing", "loc": ["body", "image"], "msg": "Field required", "input": None}]
+
+
+def test_oversized_field_is_413_and_file_is_discarded(client, dirs):
+    uploads, uploads_tmp = dirs
+    fields = {**GIG_FIELDS, "description": "x" * (main.MAX_FIELD_SIZE + 1)}
+
+    # The image part comes first, so its temp file already exists when the field overflows
+    r = client.post("/gig", files={"image": ("a.png", os.urandom(2 * 1024 * 1024))}, data=fields)
+
+    assert r.status_code == 413
+    assert os.listdir(uploads) == []
+    assert leftovers(uploads_tmp) == []
+
+
+def test_oversized_part_headers_are_413(client):
+    # Each line stays under python-multipart's own per-line limit; together they exceed ours
+    junk = b"".join(b"X-Junk-%d: " % i + b"a" * 3000 + b"\r\n" for i in range(3))
+    body = (
+        b"--b\r\n"
+        b'Content-Disposition: form-data; name="title"\r\n'
+        + junk
+        + b"\r\nt\r\n--b--\r\n"
+    )
+
+    r = client.post("/gig", content=body, headers={"Content-Type": "multipart/form-data; boundary=b"})
+
+    assert r.status_code == 413
+
+
+def test_too_many_fields_is_400(client, dirs):
+    _, uploads_tmp = dirs
+    data = {f"junk{i}": "x" for i in range(main.MAX_FIELDS + 1)}
+
+    r = client.post("/gig", data=data, files={"image": ("a.png", b"img")})
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == f"Too many fields. Maximum number of fields is {main.MAX_FIELDS}."
+    assert leftovers(uploads_tmp) == []
+
+
+def test_missing_boundary_is_400(client):
+    r = client.post("/gig", content=b"whatever", headers={"Content-Type": "multipart/form-data"})
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Expected multipart/form-data"
+
+
+def test_mismatched_boundary_is_400(client, dirs):
+    _, uploads_tmp = dirs
+    body = b'--other\r\nContent-Disposition: form-data; name="title"\r\n\r\nt\r\n--other--\r\n'
+
+    r = client.post("/gig", content=body, headers={"Content-Type": "multipart/form-data; boundary=expected"})
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid multipart data"
+    assert leftovers(uploads_tmp) == []
+
+
+@pytest.mark.parametrize("cut", [b"partial image bytes", b"whole image\r\n--b\r\n"])
+def test_truncated_body_is_400(client, dirs, cut):
+    # Cut off mid-file, or after the file part but before the closing boundary
+    uploads, uploads_tmp = dirs
+    body = b"".join(
+        b'--b\r\nContent-Disposition: form-data; name="%s"\r\n\r\n%s\r\n' % (k.encode(), v.encode())
+        for k, v in GIG_FIELDS.items()
+    )
+    body += b'--b\r\nContent-Disposition: form-data; name="image"; filename="a.png"\r\n\r\n' + cut
+
+    r = client.post("/gig", content=body, headers={"Content-Type": "multipart/form-data; boundary=b"})
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid multipart data"
+    assert os.listdir(uploads) == []
+    assert leftovers(uploads_tmp) == []
+
+
+def test_incomplete_file_is_never_stored(dirs):
+    uploads, uploads_tmp = dirs
+    upload = main._StreamedFile("a.png")
+    upload.write(b"half")
+
+    with pytest.raises(RuntimeError):
+        upload.store()
+    upload.discard()
+    assert os.listdir(uploads) == []
+    assert leftovers(uploads_tmp) == []